@@ -0,0 +1,34 @@
+"""
+STARKAI core subsystems
+Classes are imported on first access so callers only load what they use
+"""
+
+import importlib
+
+# Public class -> submodule that defines it
+_EXPORTS = {
+    "LLMEngine": "llm_engine",
+    "TonyStarkPersonality": "personality",
+    "IntelligenceCollector": "intel_collector",
+    "HardwareHelper": "hardware_helper",
+    "SystemMonitor": "system_hooks",
+    "CodeFixer": "fixer"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access (PEP 562)"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names alongside the module's own"""
+    return sorted(set(globals()) | set(__all__))
@@ -8,9 +8,15 @@ import re
 import ast
 import json
 import subprocess
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+_IGNORED_DIRS = frozenset({
+    'node_modules', '__pycache__', 'venv', 'env', 'target', 'build', '.git'
+})
+
 class CodeFixer:
     """Automated code analysis and fixing"""
     
@@ -26,6 +32,12 @@ class CodeFixer:
             '.rs': 'rust'
         }
         
+        self.analyzers = {
+            'python': self._analyze_python,
+            'javascript': self._analyze_javascript,
+            'typescript': self._analyze_javascript
+        }
+        
         self.common_fixes = {
             'python': [
                 self._fix_python_imports,
@@ -39,7 +51,7 @@ class CodeFixer:
             ]
         }
         
-        self.fix_history = []
+        self.fix_history = deque(maxlen=1000)
     
     def fix_file(self, file_path: str) -> Dict[str, Any]:
         """Analyze and fix a single file"""
@@ -112,9 +124,15 @@ class CodeFixer:
             "file_results": []
         }
         
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.supported_languages:
-                if file_path.name.startswith('.') or file_path.suffix == '.backup':
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if d[:1] != '.' and d not in _IGNORED_DIRS]
+            
+            for name in files:
+                if name[:1] == '.':
+                    continue
+                
+                file_path = Path(root) / name
+                if file_path.suffix.lower() not in self.supported_languages:
                     continue
                 
                 file_result = self.fix_file(file_path)
@@ -133,10 +151,9 @@ class CodeFixer:
         """Analyze file for issues"""
         issues = []
         
-        if language == 'python':
-            issues.extend(self._analyze_python(content))
-        elif language in ['javascript', 'typescript']:
-            issues.extend(self._analyze_javascript(content))
+        analyzer = self.analyzers.get(language)
+        if analyzer:
+            issues.extend(analyzer(content))
         
         issues.extend(self._analyze_common_issues(content))
         
@@ -431,7 +448,7 @@ class CodeFixer:
         return {
             "supported_languages": list(self.supported_languages.values()),
             "fix_history_count": len(self.fix_history),
-            "recent_fixes": self.fix_history[-5:] if self.fix_history else [],
+            "recent_fixes": list(islice(self.fix_history, max(0, len(self.fix_history) - 5), None)),
             "available_fixers": {
                 lang: len(fixers) for lang, fixers in self.common_fixes.items()
             }
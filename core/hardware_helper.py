@@ -23,6 +23,9 @@ class HardwareHelper:
         self.connected_devices = {}
         self.device_configs = {}
         self.auto_reconnect = True
+        self.port_scan_ttl = 2.0  # seconds
+        self._port_cache = None
+        self._port_cache_time = 0.0
         
     def initialize(self):
         """Initialize hardware interface"""
@@ -32,18 +35,26 @@ class HardwareHelper:
             print("⚠ PySerial library not available")
             return
         
-        available_ports = self.scan_ports()
+        available_ports = self.scan_ports(use_cache=False)
         print(f"Found {len(available_ports)} available serial ports")
         
         self._auto_connect_known_devices()
         
         print("✓ Hardware Helper initialized")
     
-    def scan_ports(self) -> List[Dict[str, str]]:
-        """Scan for available serial ports"""
+    def scan_ports(self, use_cache: bool = True) -> List[Dict[str, str]]:
+        """Scan for available serial ports
+        
+        Results are reused for port_scan_ttl seconds so that status and
+        listing commands issued back to back enumerate the ports only once.
+        """
         if not SERIAL_AVAILABLE:
             return []
         
+        now = time.time()
+        if use_cache and self._port_cache is not None and now - self._port_cache_time < self.port_scan_ttl:
+            return list(self._port_cache)
+        
         ports = []
         for port in serial.tools.list_ports.comports():
             ports.append({
@@ -55,7 +66,9 @@ class HardwareHelper:
                 "pid": port.pid
             })
         
-        return ports
+        self._port_cache = ports
+        self._port_cache_time = now
+        return list(ports)
     
     def connect_device(self, port: str, baudrate: int = 9600, timeout: float = 1.0) -> bool:
         """Connect to a serial device"""
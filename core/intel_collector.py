@@ -4,9 +4,12 @@ Provides unified interface for external data ingestion and analysis
 """
 
 import os
+import re
 import json
 import time
-from typing import Dict, List, Any, Optional
+import asyncio
+import threading
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from pathlib import Path
 
 try:
@@ -27,8 +30,16 @@ try:
 except ImportError:
     GITHUB_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 import requests
 
+INTEL_DIR = Path.home() / ".starkai" / "intel"
+
 class IntelligenceCollector:
     """Collects and analyzes data from external sources"""
     
@@ -38,6 +49,9 @@ class IntelligenceCollector:
         self.twitter_client = None
         self.github_client = None
         self.data_cache = {}
+        # praw is not thread-safe; background and foreground collections
+        # take turns on the Reddit client
+        self._reddit_lock = threading.Lock()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from creds.json"""
@@ -123,29 +137,35 @@ class IntelligenceCollector:
         if not self.reddit_client:
             return []
         
+        posts = list(self.collect_reddit_data_iter(subreddit_name, limit))
+        self.data_cache[f"reddit_{subreddit_name}"] = posts
+        return posts
+    
+    def collect_reddit_data_iter(self, subreddit_name: str, limit: int = 10) -> Iterator[Dict[str, Any]]:
+        """Yield posts from a subreddit one at a time without caching them"""
+        if not self.reddit_client:
+            return
+        
         try:
-            subreddit = self.reddit_client.subreddit(subreddit_name)
-            posts = []
-            
-            for submission in subreddit.hot(limit=limit):
-                posts.append({
-                    "id": submission.id,
-                    "title": submission.title,
-                    "author": str(submission.author),
-                    "score": submission.score,
-                    "url": submission.url,
-                    "created_utc": submission.created_utc,
-                    "num_comments": submission.num_comments,
-                    "selftext": submission.selftext[:500] if submission.selftext else "",
-                    "subreddit": subreddit_name
-                })
-            
-            self.data_cache[f"reddit_{subreddit_name}"] = posts
-            return posts
-            
+            # Held across yields: praw fetches listing pages lazily while iterating
+            with self._reddit_lock:
+                subreddit = self.reddit_client.subreddit(subreddit_name)
+                
+                for submission in subreddit.hot(limit=limit):
+                    yield {
+                        "id": submission.id,
+                        "title": submission.title,
+                        "author": str(submission.author),
+                        "score": submission.score,
+                        "url": submission.url,
+                        "created_utc": submission.created_utc,
+                        "num_comments": submission.num_comments,
+                        "selftext": submission.selftext[:500] if submission.selftext else "",
+                        "subreddit": subreddit_name
+                    }
+                
         except Exception as e:
             print(f"Reddit collection error: {e}")
-            return []
     
     def collect_twitter_data(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Collect data from Twitter search"""
@@ -229,6 +249,21 @@ class IntelligenceCollector:
             print(f"GitHub collection error: {e}")
             return {}
     
+    async def collect_reddit_data_async(self, subreddit_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Collect Reddit data on an executor thread so collections can overlap"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.collect_reddit_data, subreddit_name, limit)
+    
+    async def collect_twitter_data_async(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """Collect Twitter data on an executor thread so collections can overlap"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.collect_twitter_data, query, max_results)
+    
+    async def collect_github_data_async(self, repo_name: str) -> Dict[str, Any]:
+        """Collect GitHub data on an executor thread so collections can overlap"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.collect_github_data, repo_name)
+    
     def analyze_sentiment(self, text_data: List[str]) -> Dict[str, float]:
         """Simple sentiment analysis on collected text"""
         positive_words = ['good', 'great', 'awesome', 'excellent', 'amazing', 'love', 'best', 'perfect']
@@ -262,8 +297,9 @@ class IntelligenceCollector:
         
         if source in ["all", "reddit"] and self.reddit_client:
             try:
-                for submission in self.reddit_client.subreddit("all").hot(limit=5):
-                    topics.append(f"Reddit: {submission.title}")
+                with self._reddit_lock:
+                    for submission in self.reddit_client.subreddit("all").hot(limit=5):
+                        topics.append(f"Reddit: {submission.title}")
             except:
                 pass
         
@@ -297,6 +333,33 @@ class IntelligenceCollector:
         except Exception as e:
             print(f"Export error: {e}")
     
+    def stream_to_ndjson(self, items: Iterable[Dict[str, Any]], source: str,
+                         target: str) -> Tuple[Optional[Path], int]:
+        """Write items to a new NDJSON file as they arrive, returning the path (None if no items) and count"""
+        safe_target = re.sub(r"[^\w.-]", "_", target)
+        path = INTEL_DIR / f"{source}-{safe_target}-{time.time_ns()}.ndjson"
+        count = 0
+        f = None
+        
+        try:
+            for item in items:
+                # Opened on the first item so empty collections leave no file behind
+                if f is None:
+                    INTEL_DIR.mkdir(parents=True, exist_ok=True)
+                    f = open(path, 'xb')
+                
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(item, default=str))
+                else:
+                    f.write(json.dumps(item, default=str).encode())
+                f.write(b"\n")
+                count += 1
+        finally:
+            if f is not None:
+                f.close()
+        
+        return (path if f is not None else None), count
+    
     def get_status(self) -> Dict[str, Any]:
         """Get collector status"""
         return {
@@ -5,7 +5,7 @@ Provides unified interface for AI processing with personality integration
 
 import os
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from pathlib import Path
 
 try:
@@ -21,6 +21,7 @@ class LLMEngine:
         self.personality = personality
         self.openai_client = None
         self.local_model = None
+        self._system_prompt = None
         self.config = self._load_config()
         
     def _load_config(self) -> Dict[str, Any]:
@@ -50,36 +51,95 @@ class LLMEngine:
     
     def generate_response(self, prompt: str, context: Optional[str] = None) -> str:
         """Generate AI response with personality"""
+        if self.openai_client:
+            try:
+                response = self.openai_client.chat.completions.create(
+                    **self._chat_request(prompt, context)
+                )
+                return response.choices[0].message.content.strip()
+            except Exception as e:
+                print(f"OpenAI error: {e}")
+        
+        return self._fallback_response(prompt)
+    
+    def stream_response(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
+        """Yield the AI response in pieces as they are generated
+        
+        Intended to feed VoiceInterface.speak_stream; nothing in StarkAI wires
+        the two together yet, since StarkAI has no voice interface.
+        """
+        if self.openai_client:
+            started = False
+            try:
+                stream = self.openai_client.chat.completions.create(
+                    stream=True, **self._chat_request(prompt, context)
+                )
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        started = True
+                        yield content
+                return
+            except Exception as e:
+                print(f"OpenAI error: {e}")
+                # Part of the reply already went out; don't append a fallback to it
+                if started:
+                    return
         
+        yield self._fallback_response(prompt)
+    
+    def _chat_request(self, prompt: str, context: Optional[str]) -> Dict[str, Any]:
+        """Build the chat completion arguments shared by the plain and streaming paths"""
         if self.personality:
             prompt = self.personality.apply_personality(prompt, context)
         
+        return {
+            "model": "gpt-3.5-turbo",
+            "messages": [
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 1000,
+            "temperature": 0.7
+        }
+    
+    def summarize(self, text: str, max_chars: int = 1500) -> str:
+        """Condense conversation text into a short summary"""
         if self.openai_client:
             try:
                 response = self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
-                        {"role": "system", "content": self._get_system_prompt()},
-                        {"role": "user", "content": prompt}
+                        {"role": "system", "content": "Summarize this conversation in a few sentences, "
+                                                      "keeping any facts the user may refer back to."},
+                        {"role": "user", "content": text}
                     ],
-                    max_tokens=1000,
-                    temperature=0.7
+                    max_tokens=200,
+                    temperature=0.3
                 )
                 return response.choices[0].message.content.strip()
             except Exception as e:
                 print(f"OpenAI error: {e}")
         
-        return self._fallback_response(prompt)
+        # Without an LLM, keep the most recent part of the transcript
+        return text[-max_chars:]
     
     def _get_system_prompt(self) -> str:
-        """Get system prompt with personality"""
+        """Get system prompt with personality (built once, it never varies)"""
+        if self._system_prompt is not None:
+            return self._system_prompt
+        
         base_prompt = "You are STARKAI, an advanced AI assistant."
         
         if self.personality:
             personality_prompt = self.personality.get_system_prompt()
-            return f"{base_prompt} {personality_prompt}"
+            self._system_prompt = f"{base_prompt} {personality_prompt}"
+        else:
+            self._system_prompt = base_prompt
         
-        return base_prompt
+        return self._system_prompt
     
     def _fallback_response(self, prompt: str) -> str:
         """Fallback response when no LLM is available"""
@@ -4,8 +4,21 @@ Implements behavioral traits and response patterns for the STARKAI assistant
 """
 
 import random
+import re
 from typing import List, Dict, Any, Optional
 
+_SENTIMENT_WORDS = {
+    "positive": ['good', 'great', 'awesome', 'excellent', 'perfect', 'amazing'],
+    "negative": ['bad', 'terrible', 'awful', 'horrible', 'wrong', 'error'],
+    "questioning": ['what', 'how', 'why', 'when', 'where', 'who']
+}
+_WORD_CATEGORY = {word: category for category, words in _SENTIMENT_WORDS.items() for word in words}
+# One scan for every cue word; the lookahead lets overlapping matches
+# ("whow" holds both "who" and "how") all be found
+_SENTIMENT_RE = re.compile(
+    "(?=(%s))" % "|".join(re.escape(word) for word in sorted(_WORD_CATEGORY, key=len, reverse=True))
+)
+
 class TonyStarkPersonality:
     """Tony Stark personality implementation"""
     
@@ -113,15 +126,14 @@ class TonyStarkPersonality:
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze sentiment and adjust personality response"""
         
-        positive_words = ['good', 'great', 'awesome', 'excellent', 'perfect', 'amazing']
-        negative_words = ['bad', 'terrible', 'awful', 'horrible', 'wrong', 'error']
-        question_words = ['what', 'how', 'why', 'when', 'where', 'who']
-        
-        text_lower = text.lower()
+        # Each cue word counts once, however often it appears
+        scores = dict.fromkeys(_SENTIMENT_WORDS, 0)
+        for word in set(_SENTIMENT_RE.findall(text.lower())):
+            scores[_WORD_CATEGORY[word]] += 1
         
-        positive_score = sum(1 for word in positive_words if word in text_lower)
-        negative_score = sum(1 for word in negative_words if word in text_lower)
-        question_score = sum(1 for word in question_words if word in text_lower)
+        positive_score = scores["positive"]
+        negative_score = scores["negative"]
+        question_score = scores["questioning"]
         
         total_words = len(text.split())
         
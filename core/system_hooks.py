@@ -6,10 +6,11 @@ Provides system monitoring and telemetry for the STARKAI assistant
 import os
 import time
 import json
+import heapq
 import threading
-from typing import Dict, List, Any, Optional, Set
-from pathlib import Path
-from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Set
+from collections import Counter, deque
 
 try:
     import psutil
@@ -17,19 +18,73 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Filesystems whose remote changes never reach inotify; these stay on polling
+_NETWORK_FS_PREFIXES = ('nfs', 'cifs', 'smb', 'fuse.', '9p', 'afs', 'ceph', 'glusterfs')
+
+_PROC_FILES = ('/proc/loadavg', '/proc/uptime', '/proc/stat', '/proc/meminfo', '/proc/net/dev')
+
+class _TrackedFileHandler:
+    """Watchdog event handler that queues changes for the monitor to consume"""
+    
+    events = frozenset({"created", "modified", "deleted", "moved"})
+    
+    def __init__(self, monitor: "SystemMonitor"):
+        self.monitor = monitor
+    
+    def dispatch(self, event):
+        """Queue filesystem events; filtering against tracked files happens on drain"""
+        if event.is_directory or event.event_type not in self.events:
+            return
+        
+        timestamp = time.time()
+        # For a move the source is gone ("moved", dropped like "deleted") and
+        # the destination is a separate "moved_in" (e.g. an atomic save)
+        self.monitor._file_event_ring.append((event.src_path, event.event_type, timestamp))
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self.monitor._file_event_ring.append((dest_path, "moved_in", timestamp))
+
 class SystemMonitor:
     """System monitoring and telemetry"""
     
     def __init__(self):
         self.monitoring_active = False
         self.monitor_thread = None
-        self.tracked_files = set()
+        self.tracked_files = set()  # integer handles into _path_list
+        self._path_table = {}
+        self._path_list = []
         self.tracked_processes = {}
         self.file_access_log = deque(maxlen=1000)
         self.process_log = deque(maxlen=1000)
         self.system_stats = {}
         self.monitoring_interval = 5.0  # seconds
         self.stop_monitoring_flag = threading.Event()
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="monitor-io")
+        self._observer = None
+        self._watched_dirs = set()
+        self._mount_types = []  # (mount point, fs type), longest mount point first
+        # Single producer (watchdog thread) appends without locking; it is
+        # drained by the monitor and by readers such as get_file_activity,
+        # so draining is serialised to keep the access log in order
+        self._file_event_ring = deque(maxlen=4096)
+        self._drain_lock = threading.Lock()
+        self._proc_fds = {}
+        self._prev_cpu = None
+        self.alert_thresholds = {"cpu": 90.0, "memory": 90.0}  # percent
+        self._callbacks = []
+        self._active_alerts = set()
         
     def start_monitoring(self):
         """Start system monitoring"""
@@ -44,6 +99,11 @@ class SystemMonitor:
         self.monitoring_active = True
         self.stop_monitoring_flag.clear()
         
+        self._open_proc_files()
+        
+        if WATCHDOG_AVAILABLE:
+            self._start_file_observer()
+        
         self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitor_thread.start()
         
@@ -61,17 +121,239 @@ class SystemMonitor:
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2.0)
         
+        # The /proc descriptors are closed by the monitor thread itself as it
+        # exits, so a tick still running past the join timeout can't read a
+        # closed (or reused) descriptor
+        self._stop_file_observer()
+        
         print("✓ System Monitor stopped")
     
+    def _open_proc_files(self):
+        """Keep /proc files read every tick open for the monitor's lifetime"""
+        if not hasattr(os, 'pread'):
+            return
+        
+        # A fresh dict per start, so a previous monitor thread that is still
+        # winding down only ever closes its own descriptors
+        fds = {}
+        for path in _PROC_FILES:
+            try:
+                fds[path] = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+        self._proc_fds = fds
+        
+        stat = self._read_proc_file('/proc/stat')
+        self._prev_cpu = self._parse_cpu_times(stat) if stat else None
+    
+    def _close_proc_files(self, fds: Dict[str, int]):
+        """Close a set of /proc file descriptors"""
+        if self._proc_fds is fds:
+            self._proc_fds = {}
+        
+        for fd in fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _read_proc_file(self, path: str, size: int = 65536) -> Optional[bytes]:
+        """Re-read an open /proc file from offset 0 without reopening it"""
+        fd = self._proc_fds.get(path)
+        if fd is None:
+            return None
+        
+        try:
+            return os.pread(fd, size, 0)
+        except OSError:
+            return None
+    
+    def _read_proc_bundle(self) -> Optional[Dict[str, Any]]:
+        """Read CPU, memory and network counters from /proc in one pass"""
+        stat = self._read_proc_file('/proc/stat', 4096)
+        meminfo = self._read_proc_file('/proc/meminfo')
+        net_dev = self._read_proc_file('/proc/net/dev')
+        
+        if not (stat and meminfo and net_dev):
+            return None
+        
+        return {
+            "cpu_percent": self._cpu_percent_since_last(self._parse_cpu_times(stat)),
+            "memory": self._parse_meminfo(meminfo),
+            "network": self._parse_net_dev(net_dev)
+        }
+    
+    @staticmethod
+    def _parse_cpu_times(stat: bytes) -> tuple:
+        """Return (busy, total) jiffies from the aggregate cpu line of /proc/stat"""
+        # user nice system idle iowait irq softirq steal; guest time is already
+        # counted in user/nice
+        fields = [int(value) for value in stat.split(b'\n', 1)[0].split()[1:9]]
+        total = sum(fields)
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        return total - idle, total
+    
+    def _cpu_percent_since_last(self, cpu_times: tuple) -> float:
+        """CPU utilisation between the previous sample and this one"""
+        prev, self._prev_cpu = self._prev_cpu, cpu_times
+        if prev is None:
+            return 0.0
+        
+        busy_delta = cpu_times[0] - prev[0]
+        total_delta = cpu_times[1] - prev[1]
+        if total_delta <= 0:
+            return 0.0
+        
+        return round(busy_delta / total_delta * 100, 1)
+    
+    @staticmethod
+    def _parse_meminfo(meminfo: bytes) -> Dict[str, Any]:
+        """Parse /proc/meminfo into the same figures psutil.virtual_memory reports"""
+        values = {}
+        for line in meminfo.splitlines():
+            key, _, rest = line.partition(b':')
+            values[key] = int(rest.split()[0]) * 1024
+        
+        total = values[b'MemTotal']
+        free = values.get(b'MemFree', 0)
+        cached = values.get(b'Cached', 0) + values.get(b'SReclaimable', 0)
+        available = values.get(b'MemAvailable', free + cached)
+        # psutil 6+ also defines used as total - available
+        used = total - available
+        
+        return {
+            "total": total,
+            "available": available,
+            "percent": round(used / total * 100, 1),
+            "used": used
+        }
+    
+    @staticmethod
+    def _parse_net_dev(net_dev: bytes) -> Dict[str, int]:
+        """Sum per-interface counters from /proc/net/dev"""
+        totals = {"bytes_sent": 0, "bytes_recv": 0, "packets_sent": 0, "packets_recv": 0}
+        
+        for line in net_dev.splitlines()[2:]:
+            _, _, counters = line.partition(b':')
+            fields = counters.split()
+            if len(fields) < 10:
+                continue
+            totals["bytes_recv"] += int(fields[0])
+            totals["packets_recv"] += int(fields[1])
+            totals["bytes_sent"] += int(fields[8])
+            totals["packets_sent"] += int(fields[9])
+        
+        return totals
+    
+    def _get_load_avg(self) -> Optional[tuple]:
+        """Get 1, 5 and 15 minute load averages"""
+        data = self._read_proc_file('/proc/loadavg')
+        if data:
+            return tuple(float(value) for value in data.split()[:3])
+        
+        return os.getloadavg() if hasattr(os, 'getloadavg') else None
+    
+    def _get_disk_usage(self, path: str) -> Dict[str, Any]:
+        """Get disk usage for the filesystem holding path with a single statfs"""
+        if hasattr(os, 'statvfs'):
+            st = os.statvfs(path)
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+        else:
+            total, used, free, _ = psutil.disk_usage(path)
+        
+        return {
+            "total": total,
+            "used": used,
+            "free": free,
+            "percent": (used / total) * 100 if total else 0.0
+        }
+    
+    def _get_boot_time(self) -> float:
+        """Get system boot time as a Unix timestamp"""
+        data = self._read_proc_file('/proc/uptime')
+        if data:
+            return time.time() - float(data.split()[0])
+        
+        return psutil.boot_time()
+    
+    def _start_file_observer(self):
+        """Start watchdog observer for the directories of tracked files"""
+        try:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        except Exception as e:
+            print(f"⚠ File watcher unavailable, polling instead: {e}")
+            self._observer = None
+            return
+        
+        self._mount_types = self._read_mount_types()
+        for handle in list(self.tracked_files):
+            self._watch_directory(os.path.dirname(self._path_list[handle]))
+    
+    def _stop_file_observer(self):
+        """Stop watchdog observer"""
+        if self._observer is None:
+            return
+        
+        self._observer.stop()
+        self._observer.join(timeout=2.0)
+        self._observer = None
+        self._watched_dirs.clear()
+    
+    @staticmethod
+    def _read_mount_types() -> List[tuple]:
+        """Read (mount point, fs type) pairs from /proc/self/mountinfo"""
+        mounts = []
+        try:
+            with open('/proc/self/mountinfo', 'r') as f:
+                for line in f:
+                    fields, _, rest = line.partition(' - ')
+                    mount_point = fields.split()[4].replace('\\040', ' ')
+                    mounts.append((mount_point, rest.split()[0]))
+        except (OSError, IndexError):
+            return []
+        
+        mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+        return mounts
+    
+    def _is_network_filesystem(self, directory: str) -> bool:
+        """Check whether a directory lives on a network or FUSE filesystem"""
+        path = os.path.realpath(directory)
+        for mount_point, fs_type in self._mount_types:
+            if path == mount_point or path.startswith(mount_point.rstrip('/') + '/'):
+                return fs_type.startswith(_NETWORK_FS_PREFIXES)
+        return False
+    
+    def _watch_directory(self, directory: str):
+        """Schedule a watch on a directory, leaving it to polling on failure"""
+        if self._observer is None or directory in self._watched_dirs:
+            return
+        
+        if self._is_network_filesystem(directory):
+            return
+        
+        try:
+            self._observer.schedule(_TrackedFileHandler(self), directory, recursive=False)
+            self._watched_dirs.add(directory)
+        except Exception as e:
+            print(f"⚠ Cannot watch {directory}, polling instead: {e}")
+    
     def _monitoring_loop(self):
         """Main monitoring loop"""
-        while not self.stop_monitoring_flag.wait(self.monitoring_interval):
-            try:
-                self._collect_system_stats()
-                self._monitor_processes()
-                self._monitor_file_system()
-            except Exception as e:
-                print(f"Monitoring error: {e}")
+        proc_fds = self._proc_fds
+        try:
+            while not self.stop_monitoring_flag.wait(self.monitoring_interval):
+                try:
+                    self._collect_system_stats()
+                    self._monitor_processes()
+                    self._monitor_file_system()
+                except Exception as e:
+                    print(f"Monitoring error: {e}")
+        finally:
+            self._close_proc_files(proc_fds)
     
     def _collect_system_stats(self):
         """Collect system statistics"""
@@ -79,138 +361,232 @@ class SystemMonitor:
             return
         
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
-            
-            memory = psutil.virtual_memory()
-            
-            disk = psutil.disk_usage('/')
+            bundle = self._read_proc_bundle()
             
-            network = psutil.net_io_counters()
-            
-            self.system_stats = {
-                "timestamp": time.time(),
-                "cpu": {
-                    "percent": cpu_percent,
-                    "count": cpu_count,
-                    "load_avg": os.getloadavg() if hasattr(os, 'getloadavg') else None
-                },
-                "memory": {
+            if bundle is not None:
+                cpu_percent = bundle["cpu_percent"]
+                memory_stats = bundle["memory"]
+                network_stats = bundle["network"]
+            else:
+                cpu_percent = psutil.cpu_percent(interval=1)
+                
+                memory = psutil.virtual_memory()
+                memory_stats = {
                     "total": memory.total,
                     "available": memory.available,
                     "percent": memory.percent,
                     "used": memory.used
-                },
-                "disk": {
-                    "total": disk.total,
-                    "used": disk.used,
-                    "free": disk.free,
-                    "percent": (disk.used / disk.total) * 100
-                },
-                "network": {
+                }
+                
+                network = psutil.net_io_counters()
+                network_stats = {
                     "bytes_sent": network.bytes_sent,
                     "bytes_recv": network.bytes_recv,
                     "packets_sent": network.packets_sent,
                     "packets_recv": network.packets_recv
                 }
+            
+            self.system_stats = {
+                "timestamp": time.time(),
+                "cpu": {
+                    "percent": cpu_percent,
+                    "count": psutil.cpu_count(),
+                    "load_avg": self._get_load_avg()
+                },
+                "memory": memory_stats,
+                "disk": self._get_disk_usage('/'),
+                "network": network_stats
             }
             
+            self._check_alerts(cpu_percent, memory_stats.get("percent", 0.0))
+            
         except Exception as e:
             print(f"Error collecting system stats: {e}")
     
+    def register_callback(self, callback: Callable[[Dict[str, Any]], None]):
+        """Register a callable to receive alert events from the monitor thread"""
+        self._callbacks.append(callback)
+    
+    def _check_alerts(self, cpu_percent: float, memory_percent: float):
+        """Fire callbacks when a metric first crosses its alert threshold"""
+        for metric, value in (("cpu", cpu_percent), ("memory", memory_percent)):
+            if value < self.alert_thresholds[metric]:
+                self._active_alerts.discard(metric)
+                continue
+            
+            if metric in self._active_alerts:
+                continue
+            
+            self._active_alerts.add(metric)
+            event = {
+                "type": f"high_{metric}",
+                "value": value,
+                "threshold": self.alert_thresholds[metric],
+                "timestamp": time.time()
+            }
+            for callback in self._callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Monitor callback error: {e}")
+    
     def _monitor_processes(self):
         """Monitor running processes"""
         if not PSUTIL_AVAILABLE:
             return
         
         try:
-            current_processes = {}
+            now = time.time()
+            tracked = self.tracked_processes
+            seen_pids = set()
             
             for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'create_time']):
                 try:
                     info = proc.info
                     pid = info['pid']
+                    seen_pids.add(pid)
+                    
+                    # Update rows in place; only new (or recycled) PIDs get a fresh dict
+                    row = tracked.get(pid)
+                    if row is not None and row["create_time"] == info['create_time']:
+                        row["cpu_percent"] = info['cpu_percent']
+                        row["memory_percent"] = info['memory_percent']
+                        row["timestamp"] = now
+                        continue
                     
-                    current_processes[pid] = {
+                    if row is not None:
+                        self._log_process_event("process_terminated", pid, row["name"], now)
+                    
+                    tracked[pid] = {
                         "name": info['name'],
                         "cpu_percent": info['cpu_percent'],
                         "memory_percent": info['memory_percent'],
                         "create_time": info['create_time'],
-                        "timestamp": time.time()
+                        "timestamp": now
                     }
+                    self._log_process_event("process_started", pid, info['name'], now)
                     
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            new_pids = set(current_processes.keys()) - set(self.tracked_processes.keys())
-            for pid in new_pids:
-                self.process_log.append({
-                    "event": "process_started",
-                    "pid": pid,
-                    "name": current_processes[pid]["name"],
-                    "timestamp": time.time()
-                })
-            
-            terminated_pids = set(self.tracked_processes.keys()) - set(current_processes.keys())
+            # Key views support set algebra directly, so no temporary sets are built
+            terminated_pids = tracked.keys() - seen_pids
             for pid in terminated_pids:
-                self.process_log.append({
-                    "event": "process_terminated",
-                    "pid": pid,
-                    "name": self.tracked_processes[pid]["name"],
-                    "timestamp": time.time()
-                })
-            
-            self.tracked_processes = current_processes
+                self._log_process_event("process_terminated", pid, tracked.pop(pid)["name"], now)
             
         except Exception as e:
             print(f"Error monitoring processes: {e}")
     
+    def _log_process_event(self, event: str, pid: int, name: str, timestamp: float):
+        """Append a process lifecycle event to the process log"""
+        self.process_log.append({
+            "event": event,
+            "pid": pid,
+            "name": name,
+            "timestamp": timestamp
+        })
+    
+    def _drain_file_events(self):
+        """Move queued watchdog events for tracked files into the access log"""
+        ring = self._file_event_ring
+        with self._drain_lock:
+            while ring:
+                try:
+                    path, event_type, timestamp = ring.popleft()
+                except IndexError:
+                    break
+                
+                handle = self._path_table.get(path)
+                if handle is None or handle not in self.tracked_files:
+                    continue
+                
+                self.file_access_log.append({
+                    "file": handle,
+                    "event": event_type,
+                    "timestamp": timestamp
+                })
+                if event_type in ("deleted", "moved"):
+                    self.tracked_files.discard(handle)
+    
     def _monitor_file_system(self):
-        """Monitor file system changes"""
-        for file_path in list(self.tracked_files):
+        """Poll tracked files that are not covered by the file watcher"""
+        self._drain_file_events()
+        
+        now = time.time()
+        for handle in list(self.tracked_files):
+            file_path = self._path_list[handle]
+            if os.path.dirname(file_path) in self._watched_dirs:
+                continue
+            
             try:
                 if os.path.exists(file_path):
                     stat = os.stat(file_path)
                     self.file_access_log.append({
-                        "file": file_path,
+                        "file": handle,
                         "mtime": stat.st_mtime,
                         "size": stat.st_size,
-                        "timestamp": time.time()
+                        "timestamp": now
                     })
                 else:
                     self.file_access_log.append({
-                        "file": file_path,
+                        "file": handle,
                         "event": "deleted",
-                        "timestamp": time.time()
+                        "timestamp": now
                     })
-                    self.tracked_files.remove(file_path)
+                    self.tracked_files.remove(handle)
                     
             except Exception as e:
                 print(f"Error monitoring file {file_path}: {e}")
     
-    def track_file(self, file_path: str):
+    def _intern_path(self, file_path: str) -> int:
+        """Return the integer handle for a path, assigning one if needed"""
+        handle = self._path_table.get(file_path)
+        if handle is None:
+            handle = len(self._path_list)
+            self._path_list.append(file_path)
+            self._path_table[file_path] = handle
+        return handle
+    
+    def _resolve_file_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the path handle in a file log entry with the path"""
+        return {**event, "file": self._path_list[event["file"]]}
+    
+    def track_file(self, file_path: str) -> int:
         """Add file to monitoring"""
-        self.tracked_files.add(os.path.abspath(file_path))
+        file_path = os.path.abspath(file_path)
+        handle = self._intern_path(file_path)
+        self.tracked_files.add(handle)
+        self._watch_directory(os.path.dirname(file_path))
+        return handle
     
     def untrack_file(self, file_path: str):
         """Remove file from monitoring"""
-        self.tracked_files.discard(os.path.abspath(file_path))
+        handle = self._path_table.get(os.path.abspath(file_path))
+        if handle is not None:
+            self.tracked_files.discard(handle)
     
     def track_directory(self, directory: str, recursive: bool = False):
         """Track all files in a directory"""
-        dir_path = Path(directory)
-        
-        if not dir_path.exists():
+        if not os.path.isdir(directory):
             return
         
-        if recursive:
-            for file_path in dir_path.rglob('*'):
-                if file_path.is_file():
-                    self.track_file(str(file_path))
-        else:
-            for file_path in dir_path.iterdir():
-                if file_path.is_file():
-                    self.track_file(str(file_path))
+        for file_path in self._iter_files(os.path.abspath(directory), recursive):
+            self.track_file(file_path)
+    
+    def _iter_files(self, directory: str, recursive: bool):
+        """Yield file paths under a directory using scandir's cached entry types"""
+        pending = [directory]
+        
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            yield entry.path
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except OSError:
+                continue
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get current system information"""
@@ -225,10 +601,11 @@ class SystemMonitor:
         if PSUTIL_AVAILABLE:
             try:
                 info.update({
-                    "boot_time": psutil.boot_time(),
+                    "boot_time": self._get_boot_time(),
                     "cpu_count": psutil.cpu_count(),
                     "total_memory": psutil.virtual_memory().total,
-                    "disk_usage": psutil.disk_usage('/').percent
+                    "disk_usage": self.system_stats.get("disk", {}).get("percent")
+                        or self._get_disk_usage('/')["percent"]
                 })
             except:
                 pass
@@ -241,20 +618,22 @@ class SystemMonitor:
             return {"error": "psutil not available"}
         
         try:
-            top_cpu = sorted(
-                self.tracked_processes.values(),
-                key=lambda x: x.get('cpu_percent', 0),
-                reverse=True
-            )[:5]
+            processes = list(self.tracked_processes.values())
+            
+            top_cpu = heapq.nlargest(
+                5,
+                processes,
+                key=lambda x: x.get('cpu_percent', 0)
+            )
             
-            top_memory = sorted(
-                self.tracked_processes.values(),
-                key=lambda x: x.get('memory_percent', 0),
-                reverse=True
-            )[:5]
+            top_memory = heapq.nlargest(
+                5,
+                processes,
+                key=lambda x: x.get('memory_percent', 0)
+            )
             
             return {
-                "total_processes": len(self.tracked_processes),
+                "total_processes": len(processes),
                 "top_cpu_processes": top_cpu,
                 "top_memory_processes": top_memory,
                 "recent_events": list(self.process_log)[-10:]
@@ -265,30 +644,51 @@ class SystemMonitor:
     
     def get_file_activity(self) -> Dict[str, Any]:
         """Get file system activity summary"""
+        self._drain_file_events()
+        
         return {
             "tracked_files": len(self.tracked_files),
-            "recent_file_events": list(self.file_access_log)[-10:],
-            "file_list": list(self.tracked_files)
+            "recent_file_events": [
+                self._resolve_file_event(event) for event in list(self.file_access_log)[-10:]
+            ],
+            "file_list": [self._path_list[handle] for handle in list(self.tracked_files)]
+        }
+    
+    def export_logs(self, filename: str) -> Future:
+        """Export monitoring logs to file
+        
+        The snapshot is taken immediately; serialization and disk I/O run on a
+        background worker so the monitoring loop is never blocked. Returns a
+        Future that resolves to True on success.
+        """
+        self._drain_file_events()
+        
+        logs = {
+            "system_stats": dict(self.system_stats),
+            "process_log": list(self.process_log),
+            "file_access_log": [self._resolve_file_event(event) for event in list(self.file_access_log)],
+            "tracked_files": [self._path_list[handle] for handle in list(self.tracked_files)],
+            "export_timestamp": time.time()
         }
+        
+        return self._io_executor.submit(self._write_logs, filename, logs)
     
-    def export_logs(self, filename: str):
-        """Export monitoring logs to file"""
+    def _write_logs(self, filename: str, logs: Dict[str, Any]) -> bool:
+        """Serialize logs and write them to disk (runs on the I/O worker)"""
         try:
-            logs = {
-                "system_stats": self.system_stats,
-                "process_log": list(self.process_log),
-                "file_access_log": list(self.file_access_log),
-                "tracked_files": list(self.tracked_files),
-                "export_timestamp": time.time()
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(logs, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(logs, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(logs, f, indent=2, default=str)
             
             print(f"Logs exported to {filename}")
+            return True
             
         except Exception as e:
             print(f"Error exporting logs: {e}")
+            return False
     
     def analyze_usage_patterns(self) -> Dict[str, Any]:
         """Analyze system usage patterns"""
@@ -299,23 +699,19 @@ class SystemMonitor:
             "file_access_frequency": {}
         }
         
-        process_activity = defaultdict(int)
-        for event in self.process_log:
-            if event.get("name"):
-                process_activity[event["name"]] += 1
+        self._drain_file_events()
         
-        patterns["most_active_processes"] = dict(
-            sorted(process_activity.items(), key=lambda x: x[1], reverse=True)[:10]
+        process_activity = Counter(
+            event["name"] for event in self.process_log if event.get("name")
         )
+        patterns["most_active_processes"] = dict(process_activity.most_common(10))
         
-        file_activity = defaultdict(int)
-        for event in self.file_access_log:
-            if event.get("file"):
-                file_activity[event["file"]] += 1
-        
-        patterns["file_access_frequency"] = dict(
-            sorted(file_activity.items(), key=lambda x: x[1], reverse=True)[:10]
+        file_activity = Counter(
+            event["file"] for event in self.file_access_log if "file" in event
         )
+        patterns["file_access_frequency"] = {
+            self._path_list[handle]: count for handle, count in file_activity.most_common(10)
+        }
         
         return patterns
     
@@ -3,91 +3,366 @@ Command Line Interface for STARKAI
 Provides interactive CLI for user interaction with the AI assistant
 """
 
+import asyncio
 import cmd
+import os
 import sys
-from typing import Optional, Dict, Any
+import threading
+from collections import deque, namedtuple
+from itertools import islice
+from typing import Optional, Dict, Any, List
 from colorama import init, Fore, Back, Style
 
-init(autoreset=True)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
-class CLI(cmd.Cmd):
-    """Interactive command line interface for STARKAI"""
-    
-    intro = f"""
-{Fore.CYAN}╔══════════════════════════════════════════════════════════════╗
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# POSIX terminals understand ANSI natively, so colorama's stdout wrapper is
+# only needed on Windows (to translate) and for pipes/files (to strip the
+# codes). Every coloured message carries its own reset instead of relying
+# on autoreset
+_NATIVE_ANSI = sys.platform != "win32" and sys.stdout.isatty()
+if not _NATIVE_ANSI:
+    init()
+
+_RESET = Style.RESET_ALL
+
+# Static messages are rendered once here
+_HEADER = Fore.CYAN
+_ERROR = Fore.RED
+_SUCCESS = Fore.GREEN
+_NOTICE = Fore.YELLOW
+
+_PROCESSING = f"{Fore.BLUE}Processing...{_RESET}"
+_NO_QUESTION = f"{_ERROR}Please provide a question{_RESET}"
+_INTERPRETING = f"{_NOTICE}Interpreting as question...{_RESET}"
+_UNKNOWN_COMMAND = f"{_ERROR}Unknown command. Type 'help' for available commands.{_RESET}"
+_INTERRUPTED = f"\n{_ERROR}Interrupted by user{_RESET}"
+_STATUS_HEADER = f"{_HEADER}=== STARKAI System Status ==={_RESET}"
+_HARDWARE_HEADER = f"{_HEADER}Available Hardware:{_RESET}"
+_GOODBYE = f"{_HEADER}STARKAI shutting down. Goodbye!{_RESET}"
+# Lines that end the session when they reach default(); at most four characters
+_EXIT_WORDS = frozenset(("exit", "quit", "bye", "eof"))
+
+
+# A subcommand line split once: name, first argument, and the untouched remainder
+_Command = namedtuple("_Command", ["name", "pos", "rest"])
+
+
+def _parse_command(line: str) -> _Command:
+    """Split a subcommand line into name, first argument and remainder"""
+    tokens = line.split(maxsplit=2)
+    tokens += [""] * (3 - len(tokens))
+    return _Command(*tokens)
+
+
+def _check(flag: bool) -> str:
+    """Render a boolean as a status mark"""
+    return '✓' if flag else '✗'
+
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print a status dict as indented JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _write_lines(lines: List[str]):
+    """Emit a block of lines with a single write to stdout"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _job_state(future) -> str:
+    """Describe how a finished background intel job ended"""
+    if future.cancelled():
+        return "cancelled"
+    if future.exception():
+        return f"failed: {future.exception()}"
+
+    result = future.result()
+    if isinstance(result, list):
+        return f"done ({len(result)} items)"
+    return "done"
+
+
+_INTRO = f"""
+{_HEADER}╔══════════════════════════════════════════════════════════════╗
 ║                        STARKAI ASSISTANT                     ║
 ║                     Tony Stark AI System                     ║
-╚══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
+╚══════════════════════════════════════════════════════════════╝{_RESET}
 
 Type 'help' for available commands or 'quit' to exit.
+
 """
+_INTRO_BYTES = _INTRO.encode("utf-8")
+
+
+HISTORY_FILE = os.path.expanduser("~/.starkai_history")
+HISTORY_LENGTH = 1000
+
+class CLI(cmd.Cmd):
+    """Interactive command line interface for STARKAI"""
     
+    # The banner is written by preloop() from its pre-encoded form
+    intro = None
+    
+    # input() writes the prompt itself, so it carries its own reset too
     prompt = f"{Fore.YELLOW}STARKAI> {Style.RESET_ALL}"
     
+    # Verbatim turns kept as LLM context; the oldest are folded into a summary
+    recent_turn_limit = 20
+    summary_batch_size = 10
+    # Most characters of history sent with a question
+    context_char_limit = 4000
+    
     def __init__(self, stark_ai):
         super().__init__()
         self.stark_ai = stark_ai
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=1000)
+        self._recent_turns = deque(maxlen=self.recent_turn_limit)
+        self._history_summary = ""
+        # Folds finish on executor threads; take turns updating the summary
+        self._summary_lock = threading.Lock()
+        self._loop = None
+        self._jobs = {}
+        # Filled from the monitor thread, printed between commands so alerts
+        # never interrupt a line being typed
+        self._notifications = deque(maxlen=100)
+        
+        # Subcommand tables: name -> (handler, minimum number of arguments)
+        self._hw_dispatch = {
+            "list": (self._hw_list, 0),
+            "connect": (self._hw_connect, 1),
+            "send": (self._hw_send, 2),
+            "disconnect": (self._hw_disconnect, 1)
+        }
+        self._intel_dispatch = {
+            "reddit": (self._intel_reddit, 1),
+            "twitter": (self._intel_twitter, 1),
+            "github": (self._intel_github, 1),
+            "status": (self._intel_status, 0),
+            "bg": (self._intel_background, 2),
+            "jobs": (self._intel_jobs, 0)
+        }
+        self._fix_dispatch = {
+            "file": (self._fix_file, 1),
+            "project": (self._fix_project, 1)
+        }
+        
+        # Command name -> help text, reflected once instead of on every help/completion
+        self._help_index = {
+            name[3:]: getattr(self, name).__doc__
+            for name in self.get_names() if name.startswith("do_")
+        }
     
     def run_interactive(self):
         """Run the interactive CLI"""
+        readline = self._setup_readline()
+        self.stark_ai.system_monitor.register_callback(self._on_monitor_event)
+        
         try:
             self.cmdloop()
         except KeyboardInterrupt:
-            print(f"\n{Fore.RED}Interrupted by user{Style.RESET_ALL}")
+            print(_INTERRUPTED)
         except Exception as e:
-            print(f"{Fore.RED}CLI Error: {e}{Style.RESET_ALL}")
+            print(f"{_ERROR}CLI Error: {e}{_RESET}")
+        finally:
+            if readline:
+                try:
+                    readline.write_history_file(HISTORY_FILE)
+                except OSError:
+                    pass
+    
+    def preloop(self):
+        """Show the banner before the first prompt"""
+        buffer = getattr(sys.stdout, "buffer", None)
+        
+        # On a POSIX terminal stdout is unwrapped, so the pre-encoded banner
+        # can go straight to the byte buffer; otherwise colorama must see it
+        if buffer is not None and _NATIVE_ANSI:
+            sys.stdout.flush()
+            buffer.write(_INTRO_BYTES)
+            buffer.flush()
+        else:
+            sys.stdout.write(_INTRO)
+    
+    def precmd(self, line):
+        """Show alerts that arrived while the command was being typed"""
+        self._flush_notifications()
+        return line
+    
+    def postcmd(self, stop, line):
+        """Show alerts raised while the command ran, before the next prompt"""
+        self._flush_notifications()
+        return stop
+    
+    def _on_monitor_event(self, event: Dict[str, Any]):
+        """Queue a system monitor alert for display"""
+        metric = event["type"].replace("high_", "").upper()
+        self._notifications.append(
+            f"{_NOTICE}⚠ {metric} at {event['value']:.1f}% "
+            f"(threshold {event['threshold']:.0f}%){_RESET}"
+        )
+    
+    def _flush_notifications(self):
+        """Print queued monitor alerts in one write"""
+        if not self._notifications:
+            return
+        
+        lines = []
+        while self._notifications:
+            lines.append(self._notifications.popleft())
+        _write_lines(lines)
+    
+    def _setup_readline(self):
+        """Enable readline with persistent history for interactive terminals"""
+        if not sys.stdin.isatty():
+            # Piped input: skip readline and tab completion entirely
+            self.completekey = None
+            return None
+        
+        try:
+            import readline
+        except ImportError:
+            return None
+        
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+        
+        return readline
     
     def do_ask(self, line):
         """Ask STARKAI a question
         Usage: ask <your question>
         """
         if not line.strip():
-            print(f"{Fore.RED}Please provide a question{Style.RESET_ALL}")
+            print(_NO_QUESTION)
             return
         
-        print(f"{Fore.BLUE}Processing...{Style.RESET_ALL}")
-        
+        print(_PROCESSING)
+        self._ask_impl(line)
+    
+    def _ask_impl(self, question: str):
+        """Generate, print and remember a response to a non-empty question"""
         try:
-            response = self.stark_ai.llm_engine.generate_response(line)
-            print(f"{Fore.GREEN}STARKAI: {response}{Style.RESET_ALL}")
+            response = self.stark_ai.llm_engine.generate_response(
+                question, context=self._conversation_context()
+            )
+            print(f"{_SUCCESS}STARKAI: {response}{_RESET}")
             
-            self.conversation_history.append({
-                "user": line,
-                "assistant": response
-            })
+            self._remember_turn(question, response)
             
         except Exception as e:
-            print(f"{Fore.RED}Error generating response: {e}{Style.RESET_ALL}")
+            print(f"{_ERROR}Error generating response: {e}{_RESET}")
+    
+    def _remember_turn(self, user: str, assistant: str):
+        """Record a turn, folding the oldest verbatim turns into the summary"""
+        turn = {"user": user, "assistant": assistant}
+        self.conversation_history.append(turn)
+        self._recent_turns.append(turn)
+        
+        if len(self._recent_turns) < self.recent_turn_limit:
+            return
+        
+        oldest = [self._recent_turns.popleft() for _ in range(self.summary_batch_size)]
+        transcript = "\n".join(
+            f"User: {t['user']}\nSTARKAI: {t['assistant']}" for t in oldest
+        )
+        # Summarizing is an LLM call; keep it off the prompt
+        self._run_async(self._fold_history(transcript))
+    
+    async def _fold_history(self, transcript: str):
+        """Merge a transcript into the rolling summary on an executor thread"""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._fold_history_sync, transcript)
+    
+    def _fold_history_sync(self, transcript: str):
+        """Merge a transcript into the rolling summary"""
+        with self._summary_lock:
+            self._history_summary = self.stark_ai.llm_engine.summarize(
+                f"{self._history_summary}\n{transcript}".strip()
+            )
+    
+    def _conversation_context(self) -> Optional[str]:
+        """Build LLM context from the summary and the newest turns that fit"""
+        budget = self.context_char_limit
+        parts = []
+        for t in reversed(self._recent_turns):
+            text = f"User: {t['user']}\nSTARKAI: {t['assistant']}"
+            if len(text) > budget:
+                break
+            parts.append(text)
+            budget -= len(text) + 1
+        
+        if self._history_summary:
+            summary = f"Summary of earlier conversation: {self._history_summary}"
+            if len(summary) <= budget:
+                parts.append(summary)
+        
+        return "\n".join(reversed(parts)) or None
     
     def do_status(self, line):
         """Show system status
         Usage: status
         """
-        print(f"{Fore.CYAN}=== STARKAI System Status ==={Style.RESET_ALL}")
-        
-        llm_status = self.stark_ai.llm_engine.get_status()
-        print(f"LLM Engine:")
-        print(f"  OpenAI: {'✓' if llm_status['openai_available'] else '✗'}")
-        print(f"  Local Model: {'✓' if llm_status['local_model_available'] else '✗'}")
-        print(f"  Personality: {'✓' if llm_status['personality_active'] else '✗'}")
-        
-        hw_status = self.stark_ai.hardware_helper.get_status()
-        print(f"Hardware:")
-        print(f"  Connected Devices: {hw_status['connected_devices']}")
-        print(f"  Available Ports: {len(hw_status['available_ports'])}")
-        
-        sys_status = self.stark_ai.system_monitor.get_status()
-        print(f"System Monitor:")
-        print(f"  Active: {'✓' if sys_status['monitoring_active'] else '✗'}")
-        print(f"  Tracked Files: {sys_status['tracked_files']}")
-        print(f"  Tracked Processes: {sys_status['tracked_processes']}")
-        
-        intel_status = self.stark_ai.intel_collector.get_status()
-        print(f"Intelligence Collector:")
-        print(f"  Reddit: {'✓' if intel_status['reddit_connected'] else '✗'}")
-        print(f"  Twitter: {'✓' if intel_status['twitter_connected'] else '✗'}")
-        print(f"  GitHub: {'✓' if intel_status['github_connected'] else '✗'}")
+        llm_status, hw_status, sys_status, intel_status = self._run_async(
+            self._gather_status()
+        ).result()
+        
+        _write_lines([
+            _STATUS_HEADER,
+            "LLM Engine:",
+            f"  OpenAI: {_check(llm_status['openai_available'])}",
+            f"  Local Model: {_check(llm_status['local_model_available'])}",
+            f"  Personality: {_check(llm_status['personality_active'])}",
+            "Hardware:",
+            f"  Connected Devices: {hw_status['connected_devices']}",
+            f"  Available Ports: {len(hw_status['available_ports'])}",
+            "System Monitor:",
+            f"  Active: {_check(sys_status['monitoring_active'])}",
+            f"  Tracked Files: {sys_status['tracked_files']}",
+            f"  Tracked Processes: {sys_status['tracked_processes']}",
+            "Intelligence Collector:",
+            f"  Reddit: {_check(intel_status['reddit_connected'])}",
+            f"  Twitter: {_check(intel_status['twitter_connected'])}",
+            f"  GitHub: {_check(intel_status['github_connected'])}"
+        ])
+    
+    async def _gather_status(self):
+        """Query every subsystem's status concurrently"""
+        loop = asyncio.get_running_loop()
+        probes = (
+            self.stark_ai.llm_engine.get_status,
+            self.stark_ai.hardware_helper.get_status,
+            self.stark_ai.system_monitor.get_status,
+            self.stark_ai.intel_collector.get_status
+        )
+        return await asyncio.gather(*(loop.run_in_executor(None, probe) for probe in probes))
+    
+    def _dispatch(self, table, command, invalid_message):
+        """Run the subcommand handler if enough arguments were given"""
+        entry = table.get(command.name)
+        given = bool(command.pos) + bool(command.rest)
+        
+        if entry is None or given < entry[1]:
+            print(invalid_message)
+            return
+        
+        handler, _ = entry
+        handler(command)
     
     def do_hardware(self, line):
         """Hardware interface commands
@@ -97,41 +372,41 @@ Type 'help' for available commands or 'quit' to exit.
           hardware send <device_id> <command> - Send command to device
           hardware disconnect <device_id> - Disconnect device
         """
-        args = line.split()
+        command = _parse_command(line)
         
-        if not args:
+        if not command.name:
             print("Usage: hardware <list|connect|send|disconnect> [args]")
             return
         
-        command = args[0]
-        
-        if command == "list":
-            devices = self.stark_ai.hardware_helper.list_devices()
-            print(f"{Fore.CYAN}Available Hardware:{Style.RESET_ALL}")
-            for device in devices:
-                print(f"  {device}")
-        
-        elif command == "connect" and len(args) > 1:
-            port = args[1]
-            result = self.stark_ai.hardware_helper.connect_device(port)
-            if result:
-                print(f"{Fore.GREEN}Connected to {port}{Style.RESET_ALL}")
-            else:
-                print(f"{Fore.RED}Failed to connect to {port}{Style.RESET_ALL}")
-        
-        elif command == "send" and len(args) > 2:
-            device_id = args[1]
-            command_text = " ".join(args[2:])
-            result = self.stark_ai.hardware_helper.send_command(device_id, command_text)
-            print(f"Response: {result}")
-        
-        elif command == "disconnect" and len(args) > 1:
-            device_id = args[1]
-            self.stark_ai.hardware_helper.disconnect_device(device_id)
-            print(f"{Fore.YELLOW}Disconnected {device_id}{Style.RESET_ALL}")
-        
+        self._dispatch(self._hw_dispatch, command, "Invalid hardware command")
+    
+    def _hw_list(self, command):
+        """List available and connected hardware"""
+        devices = self.stark_ai.hardware_helper.list_devices()
+        lines = [_HARDWARE_HEADER]
+        lines.extend(f"  {device}" for device in devices)
+        _write_lines(lines)
+    
+    def _hw_connect(self, command):
+        """Connect to a serial device"""
+        port = command.pos
+        result = self.stark_ai.hardware_helper.connect_device(port)
+        if result:
+            print(f"{_SUCCESS}Connected to {port}{_RESET}")
         else:
-            print("Invalid hardware command")
+            print(f"{_ERROR}Failed to connect to {port}{_RESET}")
+    
+    def _hw_send(self, command):
+        """Send a command to a connected device"""
+        device_id = command.pos
+        result = self.stark_ai.hardware_helper.send_command(device_id, command.rest)
+        print(f"Response: {result}")
+    
+    def _hw_disconnect(self, command):
+        """Disconnect a device"""
+        device_id = command.pos
+        self.stark_ai.hardware_helper.disconnect_device(device_id)
+        print(f"{_NOTICE}Disconnected {device_id}{_RESET}")
     
     def do_intel(self, line):
         """Intelligence collection commands
@@ -140,41 +415,107 @@ Type 'help' for available commands or 'quit' to exit.
           intel twitter <query> - Collect from Twitter  
           intel github <repo> - Collect from GitHub
           intel status - Show collection status
+          intel bg <reddit|twitter|github> <args> - Collect in the background
+          intel jobs - Show background collection jobs
         """
-        args = line.split()
+        command = _parse_command(line)
         
-        if not args:
-            print("Usage: intel <reddit|twitter|github|status> [args]")
+        if not command.name:
+            print("Usage: intel <reddit|twitter|github|status|bg|jobs> [args]")
             return
         
-        command = args[0]
+        self._dispatch(self._intel_dispatch, command, "Invalid intel command")
+    
+    def _intel_reddit(self, command):
+        """Collect posts from a subreddit"""
+        subreddit = command.pos
+        collector = self.stark_ai.intel_collector
+        print(f"Collecting from r/{subreddit}...")
         
-        if command == "reddit" and len(args) > 1:
-            subreddit = args[1]
-            print(f"Collecting from r/{subreddit}...")
-            data = self.stark_ai.intel_collector.collect_reddit_data(subreddit)
-            print(f"Collected {len(data)} posts")
+        if not collector.reddit_client:
+            print("Collected 0 posts")
+            return
         
-        elif command == "twitter" and len(args) > 1:
-            query = " ".join(args[1:])
-            print(f"Searching Twitter for: {query}")
-            data = self.stark_ai.intel_collector.collect_twitter_data(query)
-            print(f"Collected {len(data)} tweets")
+        try:
+            path, count = collector.stream_to_ndjson(
+                collector.collect_reddit_data_iter(subreddit), "reddit", subreddit
+            )
+        except OSError as e:
+            print(f"{_ERROR}Could not save posts: {e}{_RESET}")
+            return
         
-        elif command == "github" and len(args) > 1:
-            repo = args[1]
-            print(f"Analyzing GitHub repo: {repo}")
-            data = self.stark_ai.intel_collector.collect_github_data(repo)
-            print(f"Collected repository data")
+        print(f"Collected {count} posts -> {path}" if path else "Collected 0 posts")
+    
+    def _intel_twitter(self, command):
+        """Collect tweets matching a query"""
+        query = f"{command.pos} {command.rest}".strip()
+        print(f"Searching Twitter for: {query}")
+        data = self._run_async(self._intel_coroutine("twitter", query)).result()
+        print(f"Collected {len(data)} tweets")
+    
+    def _intel_github(self, command):
+        """Collect data for a GitHub repository"""
+        repo = command.pos
+        print(f"Analyzing GitHub repo: {repo}")
+        data = self._run_async(self._intel_coroutine("github", repo)).result()
+        print(f"Collected repository data")
+    
+    def _intel_coroutine(self, source: str, target: str):
+        """Build the async collection coroutine for a source, or None"""
+        collector = self.stark_ai.intel_collector
         
-        elif command == "status":
-            status = self.stark_ai.intel_collector.get_status()
-            print(f"Intelligence Collection Status:")
-            for key, value in status.items():
-                print(f"  {key}: {value}")
+        if source == "reddit":
+            return collector.collect_reddit_data_async(target.split(maxsplit=1)[0])
+        if source == "twitter":
+            return collector.collect_twitter_data_async(target)
+        if source == "github":
+            return collector.collect_github_data_async(target.split(maxsplit=1)[0])
+        return None
+    
+    def _intel_background(self, command):
+        """Start a collection job without waiting for it"""
+        source, target = command.pos, command.rest
+        coroutine = self._intel_coroutine(source, target)
         
-        else:
+        if coroutine is None:
             print("Invalid intel command")
+            return
+        
+        job_id = len(self._jobs) + 1
+        description = f"{source} {target}"
+        future = self._run_async(coroutine)
+        self._jobs[job_id] = (description, "running")
+        
+        def finished(f):
+            # Keep only a one-line outcome so the result itself can be freed
+            self._jobs[job_id] = (description, _job_state(f))
+        
+        future.add_done_callback(finished)
+        print(f"Started intel job {job_id}; check progress with 'intel jobs'")
+    
+    def _intel_jobs(self, command):
+        """List background collection jobs and their state"""
+        if not self._jobs:
+            print("No intel jobs")
+            return
+        
+        lines = ["Intel Jobs:"]
+        for job_id, (description, state) in list(self._jobs.items()):
+            lines.append(f"  [{job_id}] {description} - {state}")
+        _write_lines(lines)
+    
+    def _run_async(self, coroutine):
+        """Schedule a coroutine on the CLI's background event loop"""
+        if self._loop is None:
+            self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+    
+    def _intel_status(self, command):
+        """Show intelligence collection status"""
+        status = self.stark_ai.intel_collector.get_status()
+        _write_lines(["Intelligence Collection Status:", _dumps(status)])
     
     def do_fix(self, line):
         """Code fixing commands
@@ -182,28 +523,27 @@ Type 'help' for available commands or 'quit' to exit.
           fix file <filepath> - Analyze and fix code file
           fix project <directory> - Fix entire project
         """
-        args = line.split()
+        command = _parse_command(line)
         
-        if not args:
+        if not command.name:
             print("Usage: fix <file|project> <path>")
             return
         
-        command = args[0]
-        
-        if command == "file" and len(args) > 1:
-            filepath = args[1]
-            print(f"Analyzing {filepath}...")
-            result = self.stark_ai.code_fixer.fix_file(filepath)
-            print(f"Fix result: {result}")
-        
-        elif command == "project" and len(args) > 1:
-            directory = args[1]
-            print(f"Fixing project in {directory}...")
-            result = self.stark_ai.code_fixer.fix_project(directory)
-            print(f"Project fix complete: {result}")
-        
-        else:
-            print("Invalid fix command")
+        self._dispatch(self._fix_dispatch, command, "Invalid fix command")
+    
+    def _fix_file(self, command):
+        """Analyze and fix a single file"""
+        filepath = command.pos
+        print(f"Analyzing {filepath}...")
+        result = self.stark_ai.code_fixer.fix_file(filepath)
+        print(f"Fix result: {result}")
+    
+    def _fix_project(self, command):
+        """Fix all supported files in a directory"""
+        directory = command.pos
+        print(f"Fixing project in {directory}...")
+        result = self.stark_ai.code_fixer.fix_project(directory)
+        print(f"Project fix complete: {result}")
     
     def do_history(self, line):
         """Show conversation history
@@ -214,25 +554,29 @@ Type 'help' for available commands or 'quit' to exit.
         except ValueError:
             count = 10
         
-        print(f"{Fore.CYAN}=== Conversation History (last {count}) ==={Style.RESET_ALL}")
+        history = self.conversation_history
+        recent = islice(history, max(0, len(history) - count), None)
         
-        for i, entry in enumerate(self.conversation_history[-count:], 1):
-            print(f"{Fore.YELLOW}{i}. User: {entry['user']}{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}   STARKAI: {entry['assistant']}{Style.RESET_ALL}")
-            print()
+        lines = [f"{_HEADER}=== Conversation History (last {count}) ==={_RESET}"]
+        for i, entry in enumerate(recent, 1):
+            lines.append(f"{_NOTICE}{i}. User: {entry['user']}{_RESET}")
+            lines.append(f"{_SUCCESS}   STARKAI: {entry['assistant']}{_RESET}")
+            lines.append("")
+        _write_lines(lines)
     
     def do_clear(self, line):
         """Clear the screen
         Usage: clear
         """
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # colorama translates these sequences for Windows consoles
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
     
     def do_quit(self, line):
         """Exit STARKAI
         Usage: quit
         """
-        print(f"{Fore.CYAN}STARKAI shutting down. Goodbye!{Style.RESET_ALL}")
+        print(_GOODBYE)
         return True
     
     def do_exit(self, line):
@@ -241,13 +585,38 @@ Type 'help' for available commands or 'quit' to exit.
         """
         return self.do_quit(line)
     
+    def do_help(self, arg):
+        """Show help for a command, or list commands
+        Usage: help [command]
+        """
+        name = arg.strip()
+        if name and name not in self._help_index:
+            matches = [n for n in self._help_index if n.startswith(name)]
+            if len(matches) == 1:
+                name = matches[0]
+        
+        doc = self._help_index.get(name)
+        if doc:
+            self.stdout.write(f"{doc}\n")
+            return
+        
+        super().do_help(arg)
+    
+    def completenames(self, text, *ignored):
+        """Complete command names from the prebuilt help index"""
+        return [name for name in self._help_index if name.startswith(text)]
+    
     def default(self, line):
         """Handle unknown commands by treating them as questions"""
-        if line.strip():
-            print(f"{Fore.YELLOW}Interpreting as question...{Style.RESET_ALL}")
-            self.do_ask(line)
+        if len(line) <= 4 and line.lower() in _EXIT_WORDS:
+            return self.do_quit(line)
+        
+        question = line.strip()
+        if question:
+            print(_INTERPRETING)
+            self._ask_impl(question)
         else:
-            print(f"{Fore.RED}Unknown command. Type 'help' for available commands.{Style.RESET_ALL}")
+            print(_UNKNOWN_COMMAND)
     
     def emptyline(self):
         """Handle empty line input"""
@@ -3,37 +3,82 @@ Voice Interface - Placeholder for voice integration (currently disabled)
 Future implementation for speech-to-text and text-to-speech capabilities
 """
 
+import importlib.util
 import os
+import re
+import threading
 import time
-from typing import Dict, List, Any, Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# find_spec locates a package without executing it, so probing stays cheap
+# even when the speech libraries are slow to import
+SPEECH_RECOGNITION_AVAILABLE = importlib.util.find_spec("speech_recognition") is not None
+TEXT_TO_SPEECH_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
+PORCUPINE_AVAILABLE = importlib.util.find_spec("pvporcupine") is not None
+
+# Whitespace after sentence-ending punctuation; speech is synthesized per sentence
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# Distinct command phrases remembered before the match cache is reset
+_MATCH_CACHE_SIZE = 1024
+_MISS = object()
 
 class VoiceInterface:
     """Voice interface for STARKAI (placeholder implementation)"""
     
+    __slots__ = (
+        "enabled", "speech_recognition_available", "text_to_speech_available",
+        "wake_word", "_wake_word_lc", "_wake_len", "listening",
+        "_cmd_names", "_cmd_callbacks", "_cmd_index", "_cmd_names_cache",
+        "_match_cache", "_cmd_lock", "_cmd_version",
+        "_automaton", "_automaton_dirty", "_command_executor", "_porcupine"
+    )
+    
     def __init__(self):
         self.enabled = False
         self.speech_recognition_available = False
         self.text_to_speech_available = False
-        self.voice_commands = {}
+        # Commands are stored as parallel lists; a command's index is its
+        # registration order and is what the matchers return
+        self._cmd_names = []
+        self._cmd_callbacks = []
+        self._cmd_index = {}
+        self._cmd_names_cache = ()
+        self._match_cache = {}
+        # Guards registration and automaton rebuilds; submit_voice_input
+        # matches on several worker threads at once
+        self._cmd_lock = threading.Lock()
+        self._cmd_version = 0
         self.wake_word = "starkai"
+        self._wake_word_lc = self.wake_word
+        self._wake_len = len(self.wake_word)
         self.listening = False
+        self._automaton = None
+        self._automaton_dirty = False
+        self._command_executor = None
+        self._porcupine = None
         
     def initialize(self):
         """Initialize voice interface"""
         print("Voice Interface: Currently disabled (placeholder)")
         
-        try:
-            import speech_recognition
-            self.speech_recognition_available = True
+        self.speech_recognition_available = SPEECH_RECOGNITION_AVAILABLE
+        if SPEECH_RECOGNITION_AVAILABLE:
             print("✓ Speech recognition library available")
-        except ImportError:
+        else:
             print("⚠ Speech recognition library not available")
         
-        try:
-            import pyttsx3
-            self.text_to_speech_available = True
+        self.text_to_speech_available = TEXT_TO_SPEECH_AVAILABLE
+        if TEXT_TO_SPEECH_AVAILABLE:
             print("✓ Text-to-speech library available")
-        except ImportError:
+        else:
             print("⚠ Text-to-speech library not available")
         
         print("Voice Interface initialized (disabled)")
@@ -52,6 +97,12 @@ class VoiceInterface:
         """Disable voice interface"""
         self.enabled = False
         self.listening = False
+        self._release_wake_detector()
+        
+        if self._command_executor is not None:
+            self._command_executor.shutdown(wait=False)
+            self._command_executor = None
+        
         print("Voice interface disabled")
     
     def start_listening(self):
@@ -63,39 +114,167 @@ class VoiceInterface:
         self.listening = True
         print(f"Listening for wake word: '{self.wake_word}'...")
         
+        if self._porcupine is None:
+            self._porcupine = self._create_wake_detector()
+            if self._porcupine is not None:
+                print("✓ On-device wake word detection active")
+        
         # Placeholder implementation
         print("Voice listening started (placeholder - no actual audio processing)")
     
     def stop_listening(self):
         """Stop listening for voice commands"""
         self.listening = False
+        self._release_wake_detector()
         print("Voice listening stopped")
     
+    def _create_wake_detector(self):
+        """Create an on-device Porcupine wake word detector, or None if unavailable"""
+        access_key = os.getenv("PICOVOICE_ACCESS_KEY")
+        if not PORCUPINE_AVAILABLE or not access_key:
+            return None
+        
+        import pvporcupine
+        
+        try:
+            # Custom wake words such as "starkai" need a trained keyword file
+            model_path = os.getenv("STARKAI_WAKE_WORD_MODEL")
+            if model_path:
+                return pvporcupine.create(access_key=access_key, keyword_paths=[model_path])
+            if self.wake_word in pvporcupine.KEYWORDS:
+                return pvporcupine.create(access_key=access_key, keywords=[self.wake_word])
+            print(f"⚠ No wake word model for '{self.wake_word}', using transcript matching")
+        except Exception as e:
+            print(f"⚠ Wake word detector unavailable: {e}")
+        
+        return None
+    
+    def _release_wake_detector(self):
+        """Free the native wake word detector"""
+        if self._porcupine is not None:
+            self._porcupine.delete()
+            self._porcupine = None
+    
+    def detect_wake_word(self, pcm) -> bool:
+        """Check one frame of 16-bit PCM samples for the wake word on-device"""
+        if self._porcupine is None:
+            return False
+        return self._porcupine.process(pcm) >= 0
+    
     def register_voice_command(self, command: str, callback: Callable):
         """Register a voice command with callback"""
-        self.voice_commands[command.lower()] = callback
+        name = command.lower()
+        
+        with self._cmd_lock:
+            index = self._cmd_index.get(name)
+            
+            if index is None:
+                self._cmd_index[name] = len(self._cmd_names)
+                self._cmd_names.append(name)
+                self._cmd_callbacks.append(callback)
+                self._cmd_names_cache = tuple(self._cmd_names)
+                self._cmd_version += 1
+                self._match_cache = {}
+                self._automaton_dirty = True
+            else:
+                self._cmd_callbacks[index] = callback
+        
         print(f"Registered voice command: '{command}'")
     
-    def process_voice_input(self, audio_text: str) -> Optional[str]:
-        """Process voice input text (placeholder)"""
+    @property
+    def voice_commands(self) -> Dict[str, Callable]:
+        """Registered commands mapped to their callbacks (a snapshot)"""
+        return dict(zip(self._cmd_names, self._cmd_callbacks))
+    
+    def process_voice_input(self, audio_text: str, wake_detected: bool = False) -> Optional[str]:
+        """Process voice input text; wake_detected means the wake word was already heard on-device"""
         if not self.enabled:
             return None
         
-        audio_text = audio_text.lower().strip()
+        # One lowercase copy and one search; the command is whatever follows the wake word
+        text = audio_text.lower()
         
-        if self.wake_word in audio_text:
-            command_text = audio_text.replace(self.wake_word, "").strip()
-            
-            for command, callback in self.voice_commands.items():
+        if wake_detected:
+            command_text = text.strip()
+        else:
+            idx = text.find(self._wake_word_lc)
+            if idx < 0:
+                return None
+            command_text = text[idx + self._wake_len:].strip()
+        
+        index = self._match_command(command_text)
+        if index is not None:
+            try:
+                return self._cmd_callbacks[index](command_text)
+            except Exception as e:
+                return f"Error executing voice command: {e}"
+        
+        return f"Voice command received: {command_text}"
+    
+    def submit_voice_input(self, audio_text: str, wake_detected: bool = False) -> Optional[Future]:
+        """Process voice input on a worker thread so recognition is not blocked"""
+        if not self.enabled:
+            return None
+        
+        if self._command_executor is None:
+            self._command_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="voice-cmd")
+        
+        return self._command_executor.submit(self.process_voice_input, audio_text, wake_detected)
+    
+    def _match_command(self, command_text: str) -> Optional[int]:
+        """Find the command index for the text, remembering repeated phrases"""
+        # Only the match is cached; callbacks run every time for their side effects
+        index = self._match_cache.get(command_text, _MISS)
+        if index is not _MISS:
+            return index
+        
+        version = self._cmd_version
+        index = self._scan_commands(command_text)
+        
+        # A registration during the scan may have changed the answer; only
+        # results computed against the current command set are remembered
+        with self._cmd_lock:
+            if version == self._cmd_version:
+                if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+                    self._match_cache.clear()
+                self._match_cache[command_text] = index
+        return index
+    
+    def _scan_commands(self, command_text: str) -> Optional[int]:
+        """Find the index of the earliest-registered command contained in the text"""
+        if not AHOCORASICK_AVAILABLE:
+            for index, command in enumerate(self._cmd_names):
                 if command in command_text:
-                    try:
-                        return callback(command_text)
-                    except Exception as e:
-                        return f"Error executing voice command: {e}"
-            
-            return f"Voice command received: {command_text}"
+                    return index
+            return None
         
-        return None
+        automaton = self._build_automaton() if self._automaton_dirty else self._automaton
+        if automaton is None:
+            return None
+        
+        # One pass over the text finds every registered command; the lowest
+        # registration order wins, as with the linear scan
+        return min((index for _, index in automaton.iter(command_text)), default=None)
+    
+    def _build_automaton(self):
+        """Rebuild the command automaton after registrations and return it"""
+        with self._cmd_lock:
+            if not self._automaton_dirty:
+                return self._automaton
+            
+            automaton = None
+            if self._cmd_names:
+                automaton = ahocorasick.Automaton()
+                for index, command in enumerate(self._cmd_names):
+                    if command:
+                        automaton.add_word(command, index)
+                automaton.make_automaton()
+            
+            # Swapped in whole, and only then marked clean, so no reader sees
+            # an empty automaton mid-rebuild
+            self._automaton = automaton
+            self._automaton_dirty = False
+            return automaton
     
     def speak_text(self, text: str):
         """Convert text to speech (placeholder)"""
@@ -103,14 +282,50 @@ class VoiceInterface:
             print(f"STARKAI: {text}")
             return
         
-        # Placeholder implementation
-        print(f"🔊 STARKAI (voice): {text}")
+        # Speak sentence by sentence so playback starts after the first one is synthesized
+        for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+            if sentence:
+                self._speak_chunk(sentence)
+    
+    def speak_stream(self, token_iter: Iterable[str]) -> str:
+        """Speak streamed text as each sentence completes, returning the full text
+        
+        Meant for LLMEngine.stream_response output; StarkAI does not own a
+        VoiceInterface yet, so there is no caller in the tree.
+        """
+        if not self.enabled or not self.text_to_speech_available:
+            text = "".join(token_iter)
+            print(f"STARKAI: {text}")
+            return text
+        
+        parts = []
+        buffer = ""
+        for token in token_iter:
+            parts.append(token)
+            buffer += token
+            
+            # Every piece but the last is a finished sentence
+            *sentences, buffer = _SENTENCE_BOUNDARY.split(buffer)
+            for sentence in sentences:
+                if sentence:
+                    self._speak_chunk(sentence)
+        
+        if buffer.strip():
+            self._speak_chunk(buffer.strip())
         
+        return "".join(parts)
+    
+    def _speak_chunk(self, sentence: str):
+        """Synthesize and play one sentence (placeholder)"""
+        print(f"🔊 STARKAI (voice): {sentence}")
     
     def set_voice_settings(self, settings: Dict[str, Any]):
         """Configure voice settings"""
         if "wake_word" in settings:
             self.wake_word = settings["wake_word"].lower()
+            self._wake_word_lc = self.wake_word
+            self._wake_len = len(self.wake_word)
+            self._release_wake_detector()
             print(f"Wake word set to: '{self.wake_word}'")
         
         if "enabled" in settings:
@@ -127,8 +342,9 @@ class VoiceInterface:
             "wake_word": self.wake_word,
             "speech_recognition_available": self.speech_recognition_available,
             "text_to_speech_available": self.text_to_speech_available,
-            "registered_commands": len(self.voice_commands),
-            "command_list": list(self.voice_commands.keys())
+            "on_device_wake_word": self._porcupine is not None,
+            "registered_commands": len(self._cmd_names),
+            "command_list": self._cmd_names_cache
         }
     
     def test_voice_system(self) -> Dict[str, Any]:
@@ -140,58 +356,109 @@ class VoiceInterface:
             "speaker_access": False
         }
         
-        if self.speech_recognition_available:
-            try:
-                # Placeholder test
-                results["speech_recognition"] = True
-                print("✓ Speech recognition test passed")
-            except Exception as e:
-                print(f"✗ Speech recognition test failed: {e}")
-        
-        if self.text_to_speech_available:
-            try:
-                # Placeholder test
-                results["text_to_speech"] = True
-                print("✓ Text-to-speech test passed")
-            except Exception as e:
-                print(f"✗ Text-to-speech test failed: {e}")
+        # The probes touch independent devices, so run them side by side
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="voice-probe") as pool:
+            sr_probe = pool.submit(self._probe_sr)
+            tts_probe = pool.submit(self._probe_tts)
+            results["speech_recognition"] = sr_probe.result()
+            results["text_to_speech"] = tts_probe.result()
         
         return results
+    
+    def _probe_sr(self) -> bool:
+        """Check that speech recognition works"""
+        if not self.speech_recognition_available:
+            return False
+        
+        try:
+            # Placeholder test
+            print("✓ Speech recognition test passed")
+            return True
+        except Exception as e:
+            print(f"✗ Speech recognition test failed: {e}")
+            return False
+    
+    def _probe_tts(self) -> bool:
+        """Check that text-to-speech works"""
+        if not self.text_to_speech_available:
+            return False
+        
+        try:
+            # Placeholder test
+            print("✓ Text-to-speech test passed")
+            return True
+        except Exception as e:
+            print(f"✗ Text-to-speech test failed: {e}")
+            return False
 
 """
 To implement full voice functionality, add these dependencies to requirements.txt:
-- SpeechRecognition>=3.10.0
+- SpeechRecognition>=3.11.0 (listen(stream=True) yields audio chunks)
 - pyttsx3>=2.90
 - pyaudio>=0.2.11
+- websockets>=12.0 (streaming speech-to-text endpoint)
+- pvporcupine>=3.0.0 (optional, on-device wake word; needs PICOVOICE_ACCESS_KEY)
+- pyahocorasick>=2.0.0 (optional, single-pass voice command matching)
 
 Example implementation:
 
+Audio is captured as 16 kHz mono PCM and sent to a streaming STT service
+while the user is still speaking, so transcripts arrive about one chunk
+after the words rather than after the whole phrase has been recorded.
+With Porcupine active, audio only leaves the device for a few seconds
+after the wake word is heard locally.
+
+import array
+import asyncio
+import json
+import time
 import speech_recognition as sr
 import pyttsx3
-import threading
+import websockets
+
+STT_URL = "wss://your-streaming-stt-endpoint"
 
 class VoiceInterface:
     def __init__(self):
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # 512 samples per chunk is Porcupine's frame length at 16 kHz
+        self.microphone = sr.Microphone(sample_rate=16000, chunk_size=512)
         self.tts_engine = pyttsx3.init()
+        self._awake_until = 0.0
         
-    def listen_continuously(self):
+    async def listen_continuously(self):
         with self.microphone as source:
             self.recognizer.adjust_for_ambient_noise(source)
         
-        while self.listening:
+        # One connection per session; transcripts are read concurrently
+        async with websockets.connect(STT_URL) as ws:
+            reader = asyncio.create_task(self._read_transcripts(ws))
             try:
-                with self.microphone as source:
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
-                
-                text = self.recognizer.recognize_google(audio)
-                self.process_voice_input(text)
-                
-            except sr.WaitTimeoutError:
-                pass
-            except sr.UnknownValueError:
-                pass
-            except sr.RequestError as e:
-                print(f"Speech recognition error: {e}")
+                while self.listening:
+                    with self.microphone as source:
+                        for chunk in self.recognizer.listen(source, stream=True):
+                            if not self.listening:
+                                break
+                            
+                            pcm = chunk.get_raw_data(convert_rate=16000, convert_width=2)
+                            if self._porcupine is not None and time.monotonic() > self._awake_until:
+                                if self.detect_wake_word(array.array("h", pcm)):
+                                    self._awake_until = time.monotonic() + 5.0
+                                continue
+                            
+                            await ws.send(pcm)
+            finally:
+                reader.cancel()
+    
+    async def _read_transcripts(self, ws):
+        async for message in ws:
+            result = json.loads(message)
+            if result.get("is_final"):
+                self.submit_voice_input(result["text"], wake_detected=self._porcupine is not None)
+    
+    def _speak_chunk(self, sentence):
+        # Called once per sentence by speak_text, so the first sentence plays
+        # while the rest of the reply is still queued
+        self.tts_engine.say(sentence)
+        self.tts_engine.runAndWait()
 """
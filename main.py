@@ -7,30 +7,32 @@ Entry point for the StarkAI Assistant system
 import sys
 import os
 import argparse
-from pathlib import Path
-
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-from interface.cli import CLI
-from core.llm_engine import LLMEngine
-from core.personality import TonyStarkPersonality
-from core.intel_collector import IntelligenceCollector
-from core.hardware_helper import HardwareHelper
-from core.system_hooks import SystemMonitor
-from core.fixer import CodeFixer
 
 class StarkAI:
     """Main StarkAI Assistant orchestrator"""
     
     def __init__(self):
+        # Imported here so that 'main.py --help' doesn't load the client libraries
+        from interface.cli import CLI
+        from core import (
+            LLMEngine, TonyStarkPersonality, IntelligenceCollector, HardwareHelper, SystemMonitor
+        )
+        
         self.personality = TonyStarkPersonality()
         self.llm_engine = LLMEngine(personality=self.personality)
         self.intel_collector = IntelligenceCollector()
         self.hardware_helper = HardwareHelper()
         self.system_monitor = SystemMonitor()
-        self.code_fixer = CodeFixer()
+        self._code_fixer = None
         self.cli = CLI(self)
+    
+    @property
+    def code_fixer(self):
+        """Code fixer, imported and constructed on first use"""
+        if self._code_fixer is None:
+            from core import CodeFixer
+            self._code_fixer = CodeFixer()
+        return self._code_fixer
         
     def initialize(self):
         """Initialize all components"""